@@ -28,11 +28,13 @@ class ScviConfig:
         progress_bar_style: Literal["rich", "tqdm"] = "tqdm",
         batch_size: int = 128,
         seed: int = 0,
+        dl_num_workers: int = 0,
     ):
 
         self.verbosity = verbosity
         self.seed = seed
         self.batch_size = batch_size
+        self.dl_num_workers = dl_num_workers
         if progress_bar_style not in ["rich", "tqdm"]:
             raise ValueError("Progress bar style must be in ['rich', 'tqdm']")
         self.progress_bar_style = progress_bar_style
@@ -57,6 +59,20 @@ class ScviConfig:
         """
         self._batch_size = batch_size
 
+    @property
+    def dl_num_workers(self) -> int:
+        """
+        Number of workers for PyTorch data loaders (Default is 0).
+
+        Workers are kept alive between epochs when the installed PyTorch supports it.
+        """
+        return self._dl_num_workers
+
+    @dl_num_workers.setter
+    def dl_num_workers(self, dl_num_workers: int):
+        """Number of workers for PyTorch data loaders (Default is 0)."""
+        self._dl_num_workers = dl_num_workers
+
     @property
     def progress_bar_style(self) -> str:
         """Library to use for progress bar."""
@@ -18,9 +18,15 @@ def compute_elbo(vae, data_loader, **kwargs):
     Specifically, it is a lower bound on the marginal log likelihood
     plus a term that is constant with respect to the variational distribution.
     It still gives good insights on the modeling of the data, and is fast to compute.
+    Returns NaN if the data loader holds no cells.
     """
+    n_samples = len(data_loader.indices)
+    if n_samples == 0:
+        return np.nan
     # Iterate once over the data and compute the elbo
-    elbo = 0
+    # Per-batch sums stay on device and are reduced once, avoiding a host sync per batch;
+    # they are accumulated in double precision, independently of the model's dtype
+    elbo = []
     for i_batch, tensors in enumerate(data_loader):
         sample_batch = tensors[_CONSTANTS.X_KEY]
         local_l_mean = tensors[_CONSTANTS.LOCAL_L_MEAN_KEY]
@@ -37,10 +43,9 @@ def compute_elbo(vae, data_loader, **kwargs):
             y=labels,
             **kwargs
         )
-        elbo += torch.sum(reconst_loss + kl_divergence).item()
-    n_samples = len(data_loader.indices)
-    elbo += kl_divergence_global
-    return elbo / n_samples
+        elbo.append(torch.sum(reconst_loss + kl_divergence, dtype=torch.float64))
+    elbo = torch.stack(elbo).sum() + kl_divergence_global
+    return elbo.item() / n_samples
 
 
 def compute_reconstruction_error(vae, data_loader, **kwargs):
@@ -49,9 +54,13 @@ def compute_reconstruction_error(vae, data_loader, **kwargs):
 
     Differs from the marginal log likelihood, but still gives good
     insights on the modeling of the data, and is fast to compute.
+    Returns NaN if the data loader holds no cells.
     """
+    n_samples = len(data_loader.indices)
+    if n_samples == 0:
+        return np.nan
     # Iterate once over the data and computes the reconstruction error
-    log_lkl = 0
+    log_lkl = []
     for i_batch, tensors in enumerate(data_loader):
         sample_batch = tensors[_CONSTANTS.X_KEY]
         batch_index = tensors[_CONSTANTS.BATCH_KEY]
@@ -74,9 +83,8 @@ def compute_reconstruction_error(vae, data_loader, **kwargs):
             **kwargs
         )
 
-        log_lkl += torch.sum(reconst_loss).item()
-    n_samples = len(data_loader.indices)
-    return log_lkl / n_samples
+        log_lkl.append(torch.sum(reconst_loss, dtype=torch.float64))
+    return torch.stack(log_lkl).sum().item() / n_samples
 
 
 def compute_marginal_log_likelihood_scvi(vae, data_loader, n_samples_mc=100):
@@ -102,7 +110,9 @@ def compute_marginal_log_likelihood_scvi(vae, data_loader, n_samples_mc=100):
         batch_index = tensors[_CONSTANTS.BATCH_KEY]
         labels = tensors[_CONSTANTS.LABELS_KEY]
 
-        to_sum = torch.zeros(sample_batch.size()[0], n_samples_mc)
+        to_sum = torch.zeros(
+            sample_batch.size()[0], n_samples_mc, device=sample_batch.device
+        )
 
         for i in range(n_samples_mc):
 
@@ -157,12 +167,12 @@ def compute_marginal_log_likelihood_autozi(autozivae, data_loader, n_samples_mc=
     """
     # Uses MC sampling to compute a tighter lower bound on log p(x)
     log_lkl = 0
-    to_sum = torch.zeros((n_samples_mc,))
     alphas_betas = autozivae.get_alphas_betas(as_numpy=False)
     alpha_prior = alphas_betas["alpha_prior"]
     alpha_posterior = alphas_betas["alpha_posterior"]
     beta_prior = alphas_betas["beta_prior"]
     beta_posterior = alphas_betas["beta_posterior"]
+    to_sum = torch.zeros((n_samples_mc,), device=alpha_posterior.device)
 
     for i in range(n_samples_mc):
 
@@ -34,8 +34,9 @@ class AnnotationDataLoader(ScviDataLoader):
         all_y, all_y_pred = self.compute_predictions()
         acc = np.mean(all_y == all_y_pred)
 
-        all_y_groups = np.array([self.model.labels_groups[y] for y in all_y])
-        all_y_pred_groups = np.array([self.model.labels_groups[y] for y in all_y_pred])
+        labels_groups = np.asarray(self.model.labels_groups)
+        all_y_groups = labels_groups[all_y]
+        all_y_pred_groups = labels_groups[all_y_pred]
         h_acc = np.mean(all_y_groups == all_y_pred_groups)
 
         logger.debug("Hierarchical Acc : %.4f\n" % h_acc)
@@ -105,7 +106,7 @@ def compute_predictions(
         batch_index = tensors[_CONSTANTS.BATCH_KEY]
         labels = tensors[_CONSTANTS.LABELS_KEY]
 
-        all_y += [labels.view(-1).cpu()]
+        all_y += [labels.view(-1)]
 
         if hasattr(model, "classify"):
             y_pred = model.classify(sample_batch, batch_index)
@@ -127,9 +128,9 @@ def compute_predictions(
         if not soft:
             y_pred = y_pred.argmax(dim=-1)
 
-        all_y_pred += [y_pred.cpu()]
+        all_y_pred += [y_pred]
 
-    all_y_pred = np.array(torch.cat(all_y_pred))
-    all_y = np.array(torch.cat(all_y))
+    all_y_pred = torch.cat(all_y_pred).cpu().numpy()
+    all_y = torch.cat(all_y).cpu().numpy()
 
     return all_y, all_y_pred
@@ -1,4 +1,5 @@
 import copy
+import inspect
 import logging
 from typing import Dict, List, Optional, Union
 
@@ -7,7 +8,7 @@ import numpy as np
 import torch
 from torch.utils.data import DataLoader
 
-from scvi import _CONSTANTS
+from scvi import _CONSTANTS, settings
 from scvi.core._log_likelihood import (
     compute_elbo,
     compute_marginal_log_likelihood_autozi,
@@ -18,6 +19,21 @@ from scvi.data._scvidataset import ScviDataset
 
 logger = logging.getLogger(__name__)
 
+# `persistent_workers` was added to DataLoader in PyTorch 1.7
+_HAS_PERSISTENT_WORKERS = (
+    "persistent_workers" in inspect.signature(DataLoader).parameters
+)
+
+
+def _make_data_loader(dataset: ScviDataset, data_loader_kwargs: dict) -> DataLoader:
+    """Builds a DataLoader, keeping workers alive across epochs if there are any."""
+    if _HAS_PERSISTENT_WORKERS:
+        # derived each time, kwargs are inherited by `update` and may change workers
+        data_loader_kwargs["persistent_workers"] = (
+            data_loader_kwargs.get("num_workers", 0) > 0
+        )
+    return DataLoader(dataset, **data_loader_kwargs)
+
 
 class BatchSampler(torch.utils.data.sampler.Sampler):
     """
@@ -135,9 +151,12 @@ class ScviDataLoader:
         self.sampler_kwargs = sampler_kwargs
         sampler = BatchSampler(**self.sampler_kwargs)
         self.data_loader_kwargs = copy.copy(data_loader_kwargs)
+        # page-locked host memory lets to_cuda copy asynchronously
+        self.data_loader_kwargs.setdefault("pin_memory", use_cuda)
+        self.data_loader_kwargs.setdefault("num_workers", settings.dl_num_workers)
         # do not touch batch size here, sampler gives batched indices
         self.data_loader_kwargs.update({"sampler": sampler, "batch_size": None})
-        self.data_loader = DataLoader(self.dataset, **self.data_loader_kwargs)
+        self.data_loader = _make_data_loader(self.dataset, self.data_loader_kwargs)
         self.original_indices = self.indices
 
     @property
@@ -195,7 +214,9 @@ class ScviDataLoader:
             tensors to convert
 
         """
-        return {k: (t.cuda() if self.use_cuda else t) for k, t in tensors.items()}
+        if not self.use_cuda:
+            return tensors
+        return {k: t.cuda(non_blocking=True) for k, t in tensors.items()}
 
     def update(self, data_loader_kwargs: dict) -> "ScviDataLoader":
         """
@@ -214,7 +235,7 @@ class ScviDataLoader:
         scdl = copy.copy(self)
         scdl.data_loader_kwargs = copy.copy(self.data_loader_kwargs)
         scdl.data_loader_kwargs.update(data_loader_kwargs)
-        scdl.data_loader = DataLoader(self.dataset, **scdl.data_loader_kwargs)
+        scdl.data_loader = _make_data_loader(self.dataset, scdl.data_loader_kwargs)
         return scdl
 
     def update_batch_size(self, batch_size):
@@ -240,7 +261,7 @@ class ScviDataLoader:
         return self.update({"sampler": BatchSampler(**self.sampler_kwargs)})
 
     @torch.no_grad()
-    def elbo(self) -> torch.Tensor:
+    def elbo(self) -> float:
         """Returns the Evidence Lower Bound associated to the object."""
         elbo = compute_elbo(self.model, self)
         logger.debug("ELBO : %.4f" % elbo)
@@ -249,7 +270,7 @@ class ScviDataLoader:
     elbo.mode = "min"
 
     @torch.no_grad()
-    def reconstruction_error(self) -> torch.Tensor:
+    def reconstruction_error(self) -> float:
         """Returns the reconstruction error associated to the object."""
         reconstruction_error = compute_reconstruction_error(self.model, self)
         logger.debug("Reconstruction Error : %.4f" % reconstruction_error)
@@ -312,4 +333,4 @@ class ScviDataLoader:
         self.sampler_kwargs.update({"indices": idx})
         sampler = BatchSampler(**self.sampler_kwargs)
         self.data_loader_kwargs.update({"sampler": sampler, "batch_size": None})
-        self.data_loader = DataLoader(self.dataset, **self.data_loader_kwargs)
+        self.data_loader = _make_data_loader(self.dataset, self.data_loader_kwargs)
@@ -131,8 +131,12 @@ class TotalDataLoader(ScviDataLoader):
             keyword args for forward
 
         """
+        n_samples = len(self.indices)
+        if n_samples == 0:
+            return np.nan
         # Iterate once over the data loader and computes the total log_likelihood
-        elbo = 0
+        # per-batch sums stay on device and are reduced with a single host sync
+        elbo = []
         for _, tensors in enumerate(self):
             x, local_l_mean, local_l_var, batch_index, labels, y = _unpack_tensors(
                 tensors
@@ -152,15 +156,17 @@ class TotalDataLoader(ScviDataLoader):
                 label=labels,
                 **kwargs,
             )
-            elbo += torch.sum(
-                reconst_loss_gene
-                + reconst_loss_protein
-                + kl_div_z
-                + kl_div_gene_l
-                + kl_div_back_pro
-            ).item()
-        n_samples = len(self.indices)
-        return elbo / n_samples
+            elbo.append(
+                torch.sum(
+                    reconst_loss_gene
+                    + reconst_loss_protein
+                    + kl_div_z
+                    + kl_div_gene_l
+                    + kl_div_back_pro,
+                    dtype=torch.float64,
+                )
+            )
+        return torch.stack(elbo).sum().item() / n_samples
 
     def compute_reconstruction_error(self, vae: TOTALVAE, **kwargs):
         r"""
@@ -172,9 +178,12 @@ class TotalDataLoader(ScviDataLoader):
         This is really a helper function to self.ll, self.ll_protein, etc.
 
         """
+        n_samples = len(self.indices)
+        if n_samples == 0:
+            return np.nan, np.nan
         # Iterate once over the data loader and computes the total log_likelihood
-        log_lkl_gene = 0
-        log_lkl_protein = 0
+        # Gene and protein sums are stacked per minibatch and reduced together on device
+        log_lkl = []
         for _, tensors in enumerate(self):
             x, local_l_mean, local_l_var, batch_index, labels, y = _unpack_tensors(
                 tensors
@@ -194,10 +203,13 @@ class TotalDataLoader(ScviDataLoader):
                 label=labels,
                 **kwargs,
             )
-            log_lkl_gene += torch.sum(reconst_loss_gene).item()
-            log_lkl_protein += torch.sum(reconst_loss_protein).item()
+            log_lkl.append(
+                torch.stack([reconst_loss_gene, reconst_loss_protein]).sum(
+                    dim=1, dtype=torch.float64
+                )
+            )
 
-        n_samples = len(self.indices)
+        log_lkl_gene, log_lkl_protein = torch.stack(log_lkl).sum(dim=0).tolist()
         return log_lkl_gene / n_samples, log_lkl_protein / n_samples
 
     def compute_marginal_log_likelihood(
@@ -226,7 +238,7 @@ class TotalDataLoader(ScviDataLoader):
             x, local_l_mean, local_l_var, batch_index, labels, y = _unpack_tensors(
                 tensors
             )
-            to_sum = torch.zeros(x.size()[0], n_samples_mc)
+            to_sum = torch.zeros(x.size()[0], n_samples_mc, device=x.device)
 
             for i in range(n_samples_mc):
 
@@ -89,7 +89,8 @@ class RNASeqMixin:
             gene_mask = slice(None)
         else:
             all_genes = _get_var_names_from_setup_anndata(adata)
-            gene_mask = [True if gene in gene_list else False for gene in all_genes]
+            gene_set = set(gene_list)
+            gene_mask = [gene in gene_set for gene in all_genes]
 
         if n_samples > 1 and return_mean is False:
             if return_numpy is False:
@@ -121,12 +122,13 @@ class RNASeqMixin:
                     transform_batch=batch,
                 )[..., gene_mask]
                 output *= scaling
-                output = output.cpu().numpy()
                 per_batch_exprs.append(output)
-            per_batch_exprs = np.stack(
+            per_batch_exprs = torch.stack(
                 per_batch_exprs
             )  # shape is (len(transform_batch) x batch_size x n_var)
-            exprs += [per_batch_exprs.mean(0)]
+            # average over transform_batch on device, but move each minibatch to
+            # host so the full (cells x genes) output never sits on the device
+            exprs += [per_batch_exprs.mean(0).cpu().numpy()]
 
         if n_samples > 1:
             # The -2 axis correspond to cells.
@@ -258,7 +260,8 @@ class RNASeqMixin:
             gene_mask = slice(None)
         else:
             all_genes = _get_var_names_from_setup_anndata(adata)
-            gene_mask = [True if gene in gene_list else False for gene in all_genes]
+            gene_set = set(gene_list)
+            gene_mask = [gene in gene_set for gene in all_genes]
 
         x_new = []
         for tensors in scdl:
@@ -558,5 +561,5 @@ class RNASeqMixin:
             x = tensors[_CONSTANTS.X_KEY]
             b = tensors[_CONSTANTS.BATCH_KEY]
             library = self.model.sample_from_posterior_l(x, b, give_mean=give_mean)
-            libraries += [library.cpu()]
-        return np.array(torch.cat(libraries))
+            libraries += [library]
+        return torch.cat(libraries).cpu().numpy()
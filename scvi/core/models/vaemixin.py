@@ -213,5 +213,5 @@ class VAEMixin:
             z = self.model.sample_from_posterior_z(
                 x, b, give_mean=give_mean, n_samples=mc_samples
             )
-            latent += [z.cpu()]
-        return np.array(torch.cat(latent))
+            latent += [z]
+        return torch.cat(latent).cpu().numpy()
@@ -252,7 +252,7 @@ class SCANVAE(VAE):
         )
         kl_divergence += kl(
             Categorical(probs=probs),
-            Categorical(probs=self.y_prior.repeat(probs.size(0), 1)),
+            Categorical(probs=self.y_prior.expand(probs.size(0), -1)),
         )
         kl_divergence += kl_divergence_l
 
@@ -73,6 +73,7 @@ class TOTALVAE(nn.Module):
         * ``'ln'`` - Logistic normal with normal params N(0, 1)
     protein_batch_mask
         Dictionary where each key is a batch code, and value is for each protein, whether it was observed or not.
+        Batch codes without an entry have all their proteins treated as unobserved.
     encode_covariates
         Whether to concatenate covariates to expression in encoder
     protein_background_prior_mean
@@ -119,6 +120,7 @@ class TOTALVAE(nn.Module):
         self.n_input_proteins = n_input_proteins
         self.protein_dispersion = protein_dispersion
         self.latent_distribution = latent_distribution
+        # also builds the dense (batch, protein) mask table used in forward
         self.protein_batch_mask = protein_batch_mask
         self.use_observed_lib_size = use_observed_lib_size
 
@@ -204,6 +206,25 @@ class TOTALVAE(nn.Module):
             use_layer_norm=use_layer_norm_decoder,
         )
 
+    @property
+    def protein_batch_mask(self) -> Optional[Dict[Union[str, int], np.ndarray]]:
+        return self._protein_batch_mask
+
+    @protein_batch_mask.setter
+    def protein_batch_mask(
+        self, protein_batch_mask: Optional[Dict[Union[str, int], np.ndarray]]
+    ):
+        self._protein_batch_mask = protein_batch_mask
+        if protein_batch_mask is None:
+            self._protein_batch_mask_table = None
+            return
+        # rows of batch codes missing from the dict stay zero (unobserved)
+        n_rows = max(self.n_batch, int(max(protein_batch_mask.keys())) + 1)
+        table = torch.zeros(n_rows, self.n_input_proteins)
+        for b, mask in protein_batch_mask.items():
+            table[int(b)] = torch.from_numpy(np.asarray(mask, dtype=np.float32))
+        self._protein_batch_mask_table = table
+
     def sample_from_posterior_z(
         self,
         x: torch.Tensor,
@@ -526,13 +547,12 @@ class TOTALVAE(nn.Module):
         py_ = outputs["py_"]
 
         if self.protein_batch_mask is not None:
-            pro_batch_mask_minibatch = torch.zeros_like(y)
-            for b in torch.unique(batch_index):
-                b_indices = (batch_index == b).reshape(-1)
-                pro_batch_mask_minibatch[b_indices] = torch.tensor(
-                    self.protein_batch_mask[b.item()].astype(np.float32),
-                    device=y.device,
-                )
+            # one gather instead of a masked assignment per batch
+            mask_table = self._protein_batch_mask_table
+            if mask_table.device != y.device:
+                mask_table = mask_table.to(y.device)
+                self._protein_batch_mask_table = mask_table
+            pro_batch_mask_minibatch = mask_table[batch_index.view(-1).long()]
         else:
             pro_batch_mask_minibatch = None
 
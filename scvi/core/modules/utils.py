@@ -38,9 +38,6 @@ def one_hot(index, n_cat):
 
 
 def enumerate_discrete(x, y_dim):
-    def batch(batch_size, label):
-        labels = torch.ones(batch_size, 1, device=x.device, dtype=torch.long) * label
-        return one_hot(labels, y_dim)
-
+    # block i holds batch_size copies of the one-hot encoding of label i
     batch_size = x.size(0)
-    return torch.cat([batch(batch_size, i) for i in range(y_dim)])
+    return torch.eye(y_dim, device=x.device).repeat_interleave(batch_size, dim=0)
@@ -162,7 +162,7 @@ class VAEC(VAE):
         kl_divergence = (kl_divergence_z.view(self.n_labels, -1).t() * probs).sum(dim=1)
         kl_divergence += kl(
             Categorical(probs=probs),
-            Categorical(probs=self.y_prior.repeat(probs.size(0), 1)),
+            Categorical(probs=self.y_prior.expand(probs.size(0), -1)),
         )
         kl_divergence += kl_divergence_l
 
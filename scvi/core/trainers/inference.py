@@ -91,6 +91,7 @@ class UnsupervisedTrainer(Trainer):
         # Set up number of warmup iterations
         self.n_iter_kl_warmup = n_iter_kl_warmup
         self.n_epochs_kl_warmup = n_epochs_kl_warmup
+        self._kl_weight_fn = self._get_kl_weight_fn()
         self.normalize_loss = (
             not (
                 hasattr(self.model, "gene_likelihood")
@@ -145,17 +146,33 @@ class UnsupervisedTrainer(Trainer):
 
     @property
     def kl_weight(self):
-        epoch_criterion = self.n_epochs_kl_warmup is not None
-        iter_criterion = self.n_iter_kl_warmup is not None
-        if epoch_criterion:
-            kl_weight = min(1.0, self.epoch / self.n_epochs_kl_warmup)
-        elif iter_criterion:
-            kl_weight = min(1.0, self.n_iter / self.n_iter_kl_warmup)
+        return self._kl_weight_fn()
+
+    def _get_kl_weight_fn(self):
+        """Returns a callable computing the KL weight for the chosen warmup schedule.
+
+        The schedule is resolved once so that the per-minibatch loss does not
+        re-check which warmup criterion is in use.
+        """
+        if self.n_epochs_kl_warmup is not None:
+            # constant within an epoch, so only recomputed when the epoch changes
+            self._kl_weight_cache = (None, 1.0)
+            return self._epoch_kl_weight
+        elif self.n_iter_kl_warmup is not None:
+            return lambda: min(1.0, self.n_iter / self.n_iter_kl_warmup)
         else:
-            kl_weight = 1.0
+            return lambda: 1.0
+
+    def _epoch_kl_weight(self):
+        epoch, kl_weight = self._kl_weight_cache
+        if epoch != self.epoch:
+            kl_weight = min(1.0, self.epoch / self.n_epochs_kl_warmup)
+            self._kl_weight_cache = (self.epoch, kl_weight)
         return kl_weight
 
     def on_training_begin(self):
+        # warmup attributes may have been changed since initialization
+        self._kl_weight_fn = self._get_kl_weight_fn()
         epoch_criterion = self.n_epochs_kl_warmup is not None
         iter_criterion = self.n_iter_kl_warmup is not None
         if epoch_criterion:
@@ -7,6 +7,7 @@ import anndata
 import numpy as np
 import torch
 from torch import nn
+from torch.nn import functional as F
 
 from scvi import _CONSTANTS
 from scvi.core._log_likelihood import compute_elbo
@@ -155,7 +156,8 @@ class JVAETrainer(Trainer):
             self.optimizer.step()
 
         # Train generative model
-        self.current_loss = g_loss = self.loss(tensors_dict)
+        g_loss = self.loss(tensors_dict)
+        self.current_loss = g_loss.detach()
         self.optimizer.zero_grad()
         g_loss.backward()
         self.optimizer.step()
@@ -163,7 +165,7 @@ class JVAETrainer(Trainer):
     def training_extras_init(self, lr_d=1e-3, eps=0.01):
         self.discriminator.train()
 
-        d_params = filter(lambda p: p.requires_grad, self.discriminator.parameters())
+        d_params = [p for p in self.discriminator.parameters() if p.requires_grad]
         self.d_optimizer = torch.optim.Adam(d_params, lr=lr_d, eps=eps)
         self.train_discriminator = self.n_dataset > 1 and self.kappa > 0
 
@@ -197,21 +199,19 @@ class JVAETrainer(Trainer):
         n_classes = self.n_dataset
         losses = []
         for i, z in enumerate(latent_tensors):
-            cls_logits = nn.LogSoftmax(dim=1)(self.discriminator(z))
+            cls_logits = F.log_softmax(self.discriminator(z), dim=1)
 
             if predict_true_class:
-                cls_target = torch.zeros(
-                    n_classes, dtype=torch.float32, device=z.device
-                )
-                cls_target[i] = 1.0
+                # one-hot target on class i, no need to build it
+                cls_loss = -cls_logits[:, i].mean()
             else:
                 cls_target = torch.ones(
                     n_classes, dtype=torch.float32, device=z.device
                 ) / (n_classes - 1)
                 cls_target[i] = 0.0
 
-            l_soft = cls_logits * cls_target
-            cls_loss = -l_soft.sum(dim=1).mean()
+                l_soft = cls_logits * cls_target
+                cls_loss = -l_soft.sum(dim=1).mean()
             losses.append(cls_loss)
 
         if return_details:
@@ -273,6 +273,7 @@ class JVAETrainer(Trainer):
         y = tensors[_CONSTANTS.LABELS_KEY].squeeze_(0)
         return x, local_l_mean, local_l_var, batch_index, y
 
+    @torch.no_grad()
     def get_discriminator_confusion(self) -> np.ndarray:
         """A good mixing should lead to a uniform matrix."""
         confusion = []
@@ -285,7 +286,7 @@ class JVAETrainer(Trainer):
                 data = data.cuda()
 
             z = self.model.sample_from_posterior_z(data, mode=i, deterministic=True)
-            cls_z = nn.Softmax(dim=1)(self.discriminator(z)).detach()
+            cls_z = F.softmax(self.discriminator(z), dim=1)
 
             cls_z = cls_z.cpu().numpy()
 
@@ -293,6 +294,7 @@ class JVAETrainer(Trainer):
             confusion.append(row)
         return np.array(confusion)
 
+    @torch.no_grad()
     def get_loss_magnitude(
         self, one_sample: bool = False
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -303,9 +305,10 @@ class JVAETrainer(Trainer):
         one_sample
             Use only one batch to estimate the loss, can be much faster/less exact on big datasets
         """
-        total_reconstruction = np.zeros(self.n_dataset)
-        total_kl_divergence = np.zeros(self.n_dataset)
-        total_discriminator = np.zeros(self.n_dataset)
+        # per-minibatch losses are stacked on device and reduced once at the end
+        all_reconstruction = []
+        all_kl_divergence = []
+        all_discriminator = []
 
         for tensors_dict in self.data_loaders_loop():
             reconstruction_losses, kl_divergences = self.loss(
@@ -321,11 +324,18 @@ class JVAETrainer(Trainer):
                 return_details=True,
             )
 
-            for i in range(self.n_dataset):
-                total_reconstruction[i] += reconstruction_losses[i].item()
-                total_kl_divergence[i] += kl_divergences[i].item()
-                total_discriminator[i] += discriminator_losses[i].item()
+            all_reconstruction.append(torch.stack(reconstruction_losses))
+            all_kl_divergence.append(torch.stack(kl_divergences))
+            all_discriminator.append(torch.stack(discriminator_losses))
             if one_sample:
                 break
 
-        return total_reconstruction, total_kl_divergence, total_discriminator
+        total_reconstruction = torch.stack(all_reconstruction).sum(dim=0)
+        total_kl_divergence = torch.stack(all_kl_divergence).sum(dim=0)
+        total_discriminator = torch.stack(all_discriminator).sum(dim=0)
+
+        return (
+            total_reconstruction.cpu().numpy().astype(np.float64),
+            total_kl_divergence.cpu().numpy().astype(np.float64),
+            total_discriminator.cpu().numpy().astype(np.float64),
+        )
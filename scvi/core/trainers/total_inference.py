@@ -3,11 +3,11 @@ from typing import Union
 
 import anndata
 import torch
+from torch.nn import functional as F
 
 from scvi import _CONSTANTS
 from scvi.core.data_loaders import TotalDataLoader
 from scvi.core.modules import TOTALVAE, Classifier
-from scvi.core.modules.utils import one_hot
 from scvi.core.trainers import UnsupervisedTrainer
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,31 @@ def _unpack_tensors(tensors):
     return x, local_l_mean, local_l_var, batch_index, labels, y
 
 
+def _soft_cross_entropy(logits, target):
+    """Cross-entropy between discriminator logits and a target distribution."""
+    l_soft = F.log_softmax(logits, dim=1) * target
+    return -l_soft.sum(dim=1).mean()
+
+
+def _compile_soft_cross_entropy(device):
+    """Compiles `_soft_cross_entropy`, or returns it as is if compilation fails."""
+    try:
+        compiled = torch.compile(_soft_cross_entropy, dynamic=True)
+        # compilation is lazy and the backward graph is only built on the first
+        # backward pass, so run both once here rather than failing mid-training
+        logits = torch.randn(4, 3, device=device, requires_grad=True)
+        target = torch.full((4, 3), 0.5, device=device)
+        compiled(logits, target).backward()
+    except RuntimeError as e:
+        # dynamo and inductor errors are RuntimeErrors, e.g. unsupported Python
+        # versions, no Triton installation or GPUs Triton does not support
+        logger.warning(
+            "Could not compile the adversarial loss, using eager mode: {}".format(e)
+        )
+        return _soft_cross_entropy
+    return compiled
+
+
 class TotalTrainer(UnsupervisedTrainer):
     """
     Unsupervised training for totalVI using variational inference.
@@ -124,6 +149,11 @@ class TotalTrainer(UnsupervisedTrainer):
         self.discriminator = discriminator
         if self.use_cuda and self.discriminator is not None:
             self.discriminator.cuda()
+        # on GPU, fuse the log-softmax, product and reductions into fewer kernels
+        if self.use_cuda and hasattr(torch, "compile"):
+            self._soft_cross_entropy = _compile_soft_cross_entropy("cuda")
+        else:
+            self._soft_cross_entropy = _soft_cross_entropy
 
         if isinstance(self, TotalTrainer):
             (
@@ -161,12 +191,13 @@ class TotalTrainer(UnsupervisedTrainer):
             label,
         )
 
+        kl_weight = self.kl_weight
         loss = torch.mean(
             reconst_loss_gene
             + self.pro_recons_weight * reconst_loss_protein
-            + self.kl_weight * kl_div_z
+            + kl_weight * kl_div_z
             + kl_div_l_gene
-            + self.kl_weight * kl_div_back_pro
+            + kl_weight * kl_div_back_pro
         )
 
         return loss
@@ -175,23 +206,18 @@ class TotalTrainer(UnsupervisedTrainer):
         self, z, batch_index, predict_true_class=True, return_details=True
     ):
 
-        n_classes = self.adata.uns["_scvi"]["summary_stats"]["n_batch"]
-        cls_logits = torch.nn.LogSoftmax(dim=1)(self.discriminator(z))
+        cls_logits = self.discriminator(z)
+        n_classes = cls_logits.size(1)
 
         if predict_true_class:
-            cls_target = one_hot(batch_index, n_classes)
-        else:
-            one_hot_batch = one_hot(batch_index, n_classes)
-            cls_target = torch.zeros_like(one_hot_batch)
-            # place zeroes where true label is
-            cls_target.masked_scatter_(
-                ~one_hot_batch.bool(), torch.ones_like(one_hot_batch) / (n_classes - 1)
-            )
+            # one-hot target, so this is the cross-entropy on the batch indices
+            return F.cross_entropy(cls_logits, batch_index.view(-1))
 
-        l_soft = cls_logits * cls_target
-        loss = -l_soft.sum(dim=1).mean()
+        one_hot_batch = F.one_hot(batch_index.view(-1), n_classes).to(cls_logits.dtype)
+        # place zeroes where true label is
+        cls_target = (1 - one_hot_batch) / (n_classes - 1)
 
-        return loss
+        return self._soft_cross_entropy(cls_logits, cls_target)
 
     def _get_z(self, tensors):
         (
@@ -215,59 +241,45 @@ class TotalTrainer(UnsupervisedTrainer):
         super().train(n_epochs=n_epochs, lr=lr, eps=eps, params=params)
 
     def on_training_loop(self, tensors_dict):
+        kappa = 0
         if self.use_adversarial_loss:
-            if self.kappa is None:
-                kappa = 1 - self.kl_weight
-            else:
-                kappa = self.kappa
-            batch_index = tensors_dict[0][_CONSTANTS.BATCH_KEY]
-            if kappa > 0:
-                z = self._get_z(*tensors_dict)
-                # Train discriminator
-                d_loss = self.loss_discriminator(z.detach(), batch_index, True)
-                d_loss *= kappa
-                self.d_optimizer.zero_grad()
-                d_loss.backward()
-                self.d_optimizer.step()
-
-                # Train generative model to fool discriminator
-                fool_loss = self.loss_discriminator(z, batch_index, False)
-                fool_loss *= kappa
-
-            # Train generative model
-            self.optimizer.zero_grad()
-            self.current_loss = loss = self.loss(*tensors_dict)
-            if kappa > 0:
-                (loss + fool_loss).backward()
-            else:
-                loss.backward()
-            if self.max_grad_value is not None:
-                torch.nn.utils.clip_grad_norm_(
-                    self.optimizer.param_groups[0]["params"],
-                    self.max_grad_value,
-                    norm_type="inf",
-                )
-            self.optimizer.step()
+            kappa = 1 - self.kl_weight if self.kappa is None else self.kappa
 
-        else:
-            self.current_loss = loss = self.loss(*tensors_dict)
-            self.optimizer.zero_grad()
-            loss.backward()
-            if self.max_grad_value is not None:
-                torch.nn.utils.clip_grad_norm_(
-                    self.optimizer.param_groups[0]["params"],
-                    self.max_grad_value,
-                    norm_type="inf",
-                )
-            self.optimizer.step()
+        # the discriminator is only evaluated when its loss has a non-zero weight
+        if kappa > 0:
+            batch_index = tensors_dict[0][_CONSTANTS.BATCH_KEY]
+            z = self._get_z(*tensors_dict)
+            # Train discriminator
+            d_loss = self.loss_discriminator(z.detach(), batch_index, True)
+            d_loss *= kappa
+            self.d_optimizer.zero_grad()
+            d_loss.backward()
+            self.d_optimizer.step()
+
+            # Train generative model to fool discriminator
+            fool_loss = self.loss_discriminator(z, batch_index, False)
+            fool_loss *= kappa
+
+        # Train generative model
+        self.optimizer.zero_grad()
+        loss = self.loss(*tensors_dict)
+        self.current_loss = loss.detach()
+        if kappa > 0:
+            loss = loss + fool_loss
+        loss.backward()
+        if self.max_grad_value is not None:
+            torch.nn.utils.clip_grad_norm_(
+                self.optimizer.param_groups[0]["params"],
+                self.max_grad_value,
+                norm_type="inf",
+            )
+        self.optimizer.step()
 
     def training_extras_init(self, lr_d=1e-3, eps=0.01):
         if self.discriminator is not None:
             self.discriminator.train()
 
-            d_params = filter(
-                lambda p: p.requires_grad, self.discriminator.parameters()
-            )
+            d_params = [p for p in self.discriminator.parameters() if p.requires_grad]
             self.d_optimizer = torch.optim.Adam(d_params, lr=lr_d, eps=eps)
 
     def training_extras_end(self):
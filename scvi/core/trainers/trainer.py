@@ -97,7 +97,8 @@ class Trainer:
 
         # Training NaNs handling
         self.max_nans = max_nans
-        self.current_loss = None  # torch.Tensor training loss
+        self.current_loss = None  # detached torch.Tensor training loss
+        self._unchecked_losses = []  # losses not yet inspected for NaNs
         self.previous_loss_was_nan = False
         self.nan_counter = 0  # Counts occuring NaNs during training
 
@@ -169,7 +170,7 @@ class Trainer:
         self.model.train()
 
         if params is None:
-            params = filter(lambda p: p.requires_grad, self.model.parameters())
+            params = [p for p in self.model.parameters() if p.requires_grad]
 
         self.optimizer = torch.optim.Adam(
             params, lr=lr, eps=eps, weight_decay=self.weight_decay
@@ -184,18 +185,21 @@ class Trainer:
 
         self.on_training_begin()
 
+        # bound once, used to skip minibatches that are too small on every iteration
+        x_key = _CONSTANTS.X_KEY
         for self.epoch in track(
             range(n_epochs), description="Training...", disable=self.silent
         ):
             self.on_epoch_begin()
             for tensors_dict in self.data_loaders_loop():
-                if tensors_dict[0][_CONSTANTS.X_KEY].shape[0] < 3:
+                if tensors_dict[0][x_key].size(0) < 3:
                     continue
                 self.on_iteration_begin()
                 # Update the model's parameters after seeing the data
                 self.on_training_loop(tensors_dict)
                 # Checks the training status, ensures no nan loss
                 self.on_iteration_end()
+            self.check_training_status()
 
             # Computes metrics and controls early stopping
             if not self.on_epoch_end():
@@ -211,7 +215,9 @@ class Trainer:
         self.on_training_end()
 
     def on_training_loop(self, tensors_dict):
-        self.current_loss = loss = self.loss(*tensors_dict)
+        loss = self.loss(*tensors_dict)
+        # detached so the stored loss does not hold onto the autograd graph
+        self.current_loss = loss.detach()
         self.optimizer.zero_grad()
         loss.backward()
         self.optimizer.step()
@@ -260,7 +266,9 @@ class Trainer:
         pass
 
     def on_iteration_end(self):
-        self.check_training_status()
+        self._unchecked_losses.append(self.current_loss)
+        if len(self._unchecked_losses) >= self.max_nans:
+            self.check_training_status()
         self.n_iter += 1
 
     def on_training_end(self):
@@ -274,21 +282,28 @@ class Trainer:
         loss corresponds to the training loss of the model.
 
         `max_nans` is the maximum number of consecutive NaNs after which a ValueError will be
+
+        Losses are accumulated on device and inspected in bulk (every `max_nans` iterations
+        and at the end of each epoch) with a single device-to-host transfer.
         """
-        loss_is_nan = torch.isnan(self.current_loss).item()
-        if loss_is_nan:
-            logger.warning("Model training loss was NaN")
-            self.nan_counter += 1
-            self.previous_loss_was_nan = True
-        else:
-            self.nan_counter = 0
-            self.previous_loss_was_nan = False
+        if len(self._unchecked_losses) == 0:
+            return
+        losses_are_nan = torch.isnan(torch.stack(self._unchecked_losses)).tolist()
+        self._unchecked_losses = []
+        for loss_is_nan in losses_are_nan:
+            if loss_is_nan:
+                logger.warning("Model training loss was NaN")
+                self.nan_counter += 1
+                self.previous_loss_was_nan = True
+            else:
+                self.nan_counter = 0
+                self.previous_loss_was_nan = False
 
-        if self.nan_counter >= self.max_nans:
-            raise ValueError(
-                "Loss was NaN {} consecutive times: the model is not training properly. "
-                "Consider using a lower learning rate.".format(self.max_nans)
-            )
+            if self.nan_counter >= self.max_nans:
+                raise ValueError(
+                    "Loss was NaN {} consecutive times: the model is not training properly. "
+                    "Consider using a lower learning rate.".format(self.max_nans)
+                )
 
     @property
     @abstractmethod
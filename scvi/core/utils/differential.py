@@ -387,8 +387,11 @@ class DifferentialComputation:
         # Sampling loop
         px_scales = []
         batch_ids = []
-        for batch_idx in batchid:
-            idx = np.random.choice(np.arange(self.adata.shape[0])[selection], n_samples)
+        # cells for every batch are drawn at once, same stream as one draw per batch
+        cell_idx = np.random.choice(
+            np.arange(self.adata.shape[0])[selection], size=(len(batchid), n_samples)
+        )
+        for batch_idx, idx in zip(batchid, cell_idx):
             px_scales.append(
                 self.model_fn(self.adata, indices=idx, transform_batch=batch_idx)
             )
@@ -132,13 +132,16 @@ def _get_batch_code_from_category(
 
     categorical_mappings = adata.uns["_scvi"]["categorical_mappings"]
     batch_mappings = categorical_mappings["_scvi_batch"]["mapping"]
+    # category -> code, built once instead of scanning the mapping per category
+    batch_locs = {}
+    for loc, mapping in enumerate(batch_mappings):
+        batch_locs.setdefault(mapping, loc)
     batch_code = []
     for cat in category:
         if cat is None:
             batch_code.append(None)
-        elif cat not in batch_mappings:
+        elif cat not in batch_locs:
             raise ValueError('"{}" not a valid batch category.'.format(cat))
         else:
-            batch_loc = np.where(batch_mappings == cat)[0][0]
-            batch_code.append(batch_loc)
+            batch_code.append(batch_locs[cat])
     return batch_code
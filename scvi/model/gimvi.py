@@ -189,6 +189,7 @@ class GIMVI(VAEMixin, BaseModelClass):
 
         return post_list
 
+    @torch.no_grad()
     def get_latent_representation(
         self,
         adatas: List[AnnData] = None,
@@ -229,11 +230,12 @@ class GIMVI(VAEMixin, BaseModelClass):
                     )
                 )
 
-            latent = torch.cat(latent).cpu().detach().numpy()
+            latent = torch.cat(latent).cpu().numpy()
             latents.append(latent)
 
         return latents
 
+    @torch.no_grad()
     def get_imputed_values(
         self,
         adatas: List[AnnData] = None,
@@ -300,7 +302,7 @@ class GIMVI(VAEMixin, BaseModelClass):
                         )
                     )
 
-            imputed_value = torch.cat(imputed_value).cpu().detach().numpy()
+            imputed_value = torch.cat(imputed_value).cpu().numpy()
             imputed_values.append(imputed_value)
 
         return imputed_values
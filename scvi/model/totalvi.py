@@ -292,8 +292,8 @@ class TOTALVI(RNASeqMixin, VAEMixin, ArchesMixin, BaseModelClass):
             z = self.model.sample_from_posterior_z(
                 x, y, batch, give_mean=give_mean, n_samples=mc_samples
             )
-            latent += [z.cpu()]
-        return np.array(torch.cat(latent))
+            latent += [z]
+        return torch.cat(latent).cpu().numpy()
 
     @torch.no_grad()
     def get_latent_library_size(
@@ -333,8 +333,8 @@ class TOTALVI(RNASeqMixin, VAEMixin, ArchesMixin, BaseModelClass):
             library = self.model.sample_from_posterior_l(
                 x, y, batch, give_mean=give_mean
             )
-            libraries += [library.cpu()]
-        return np.array(torch.cat(libraries))
+            libraries += [library]
+        return torch.cat(libraries).cpu().numpy()
 
     @torch.no_grad()
     def get_normalized_expression(
@@ -417,12 +417,14 @@ class TOTALVI(RNASeqMixin, VAEMixin, ArchesMixin, BaseModelClass):
             gene_mask = slice(None)
         else:
             all_genes = _get_var_names_from_setup_anndata(adata)
-            gene_mask = [True if gene in gene_list else False for gene in all_genes]
+            gene_set = set(gene_list)
+            gene_mask = [gene in gene_set for gene in all_genes]
         if protein_list is None:
             protein_mask = slice(None)
         else:
             all_proteins = self.scvi_setup_dict_["protein_names"]
-            protein_mask = [True if p in protein_list else False for p in all_proteins]
+            protein_set = set(protein_list)
+            protein_mask = [p in protein_set for p in all_proteins]
         if indices is None:
             indices = np.arange(adata.n_obs)
 
@@ -581,7 +583,8 @@ class TOTALVI(RNASeqMixin, VAEMixin, ArchesMixin, BaseModelClass):
             protein_mask = slice(None)
         else:
             all_proteins = self.scvi_setup_dict_["protein_names"]
-            protein_mask = [True if p in protein_list else False for p in all_proteins]
+            protein_set = set(protein_list)
+            protein_mask = [p in protein_set for p in all_proteins]
 
         if n_samples > 1 and return_mean is False:
             if return_numpy is False:
@@ -798,12 +801,14 @@ class TOTALVI(RNASeqMixin, VAEMixin, ArchesMixin, BaseModelClass):
             gene_mask = slice(None)
         else:
             all_genes = _get_var_names_from_setup_anndata(adata)
-            gene_mask = [True if gene in gene_list else False for gene in all_genes]
+            gene_set = set(gene_list)
+            gene_mask = [gene in gene_set for gene in all_genes]
         if protein_list is None:
             protein_mask = slice(None)
         else:
             all_proteins = self.scvi_setup_dict_["protein_names"]
-            protein_mask = [True if p in protein_list else False for p in all_proteins]
+            protein_set = set(protein_list)
+            protein_mask = [p in protein_set for p in all_proteins]
 
         post = self._make_scvi_dl(adata=adata, indices=indices, batch_size=batch_size)
 
@@ -1,4 +1,10 @@
+import numpy as np
+import pytest
+import torch
+
 import scvi
+from scvi.core.data_loaders import ScviDataLoader, TotalDataLoader
+from scvi.core.modules import TOTALVAE
 from scvi.core.modules.vae import VAE
 from scvi.core.modules.vaec import VAEC
 from scvi.core.modules.classifier import Classifier
@@ -6,8 +12,13 @@ from scvi.core.trainers import (
     UnsupervisedTrainer,
     ClassifierTrainer,
     SemiSupervisedTrainer,
+    TotalTrainer,
 )
 from scvi.core.trainers.inference import AdapterTrainer
+from scvi.core.trainers.total_inference import (
+    _compile_soft_cross_entropy,
+    _soft_cross_entropy,
+)
 
 use_cuda = True
 
@@ -127,3 +138,125 @@ def test_annealing_procedures(save_path):
     )
     trainer_cortex_vae.train(n_epochs=2)
     assert trainer_cortex_vae.kl_weight >= 0.99, "Annealing should be over"
+
+
+def test_totalvi_adversarial_loss_falls_back_to_eager(monkeypatch):
+    def unsupported_compile(fn, **kwargs):
+        raise RuntimeError("Python version not supported")
+
+    monkeypatch.setattr(torch, "compile", unsupported_compile)
+    assert _compile_soft_cross_entropy("cpu") is _soft_cross_entropy
+
+    class FailingBackward(torch.autograd.Function):
+        @staticmethod
+        def forward(ctx, x):
+            return x.clone()
+
+        @staticmethod
+        def backward(ctx, grad):
+            raise RuntimeError("backward graph failed to compile")
+
+    def compile_with_broken_backward(fn, **kwargs):
+        return lambda logits, target: FailingBackward.apply(fn(logits, target))
+
+    monkeypatch.setattr(torch, "compile", compile_with_broken_backward)
+    assert _compile_soft_cross_entropy("cpu") is _soft_cross_entropy
+
+    def working_compile(fn, **kwargs):
+        return lambda logits, target: fn(logits, target)
+
+    monkeypatch.setattr(torch, "compile", working_compile)
+    assert _compile_soft_cross_entropy("cpu") is not _soft_cross_entropy
+
+
+def test_data_loader_num_workers_setting():
+    adata = scvi.data.synthetic_iid()
+    scvi.data.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    stats = adata.uns["_scvi"]["summary_stats"]
+    vae = VAE(stats["n_vars"], stats["n_batch"])
+
+    scvi.settings.dl_num_workers = 2
+    try:
+        scdl = ScviDataLoader(vae, adata, use_cuda=False)
+    finally:
+        scvi.settings.dl_num_workers = 0
+    assert scdl.data_loader.num_workers == 2
+    n_cells = sum(t[scvi._CONSTANTS.X_KEY].shape[0] for t in scdl)
+    assert n_cells == adata.n_obs
+
+    # turning workers off on a derived loader must not keep persistent workers
+    scdl_no_workers = scdl.update({"num_workers": 0})
+    assert scdl_no_workers.data_loader.num_workers == 0
+    n_cells = sum(t[scvi._CONSTANTS.X_KEY].shape[0] for t in scdl_no_workers)
+    assert n_cells == adata.n_obs
+
+
+def test_empty_data_loader_metrics_are_nan():
+    adata = scvi.data.synthetic_iid()
+    scvi.data.setup_anndata(
+        adata,
+        batch_key="batch",
+        labels_key="labels",
+        protein_expression_obsm_key="protein_expression",
+    )
+    stats = adata.uns["_scvi"]["summary_stats"]
+
+    vae = VAE(stats["n_vars"], stats["n_batch"])
+    scdl = ScviDataLoader(vae, adata, indices=[], use_cuda=False)
+    assert np.isnan(scdl.elbo())
+    assert np.isnan(scdl.reconstruction_error())
+
+    totalvae = TOTALVAE(stats["n_vars"], stats["n_proteins"], n_batch=stats["n_batch"])
+    total_scdl = TotalDataLoader(totalvae, adata, indices=[], use_cuda=False)
+    assert np.isnan(total_scdl.elbo())
+    assert np.isnan(total_scdl.reconstruction_error())
+    assert all(np.isnan(total_scdl.compute_reconstruction_error(totalvae)))
+
+
+def test_nan_losses_are_checked_in_bulk():
+    adata = scvi.data.synthetic_iid()
+    scvi.data.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    stats = adata.uns["_scvi"]["summary_stats"]
+    vae = VAE(stats["n_vars"], stats["n_batch"])
+    trainer = UnsupervisedTrainer(vae, adata, use_cuda=False, max_nans=3)
+    nan_loss = torch.tensor(float("nan"))
+
+    # an admissible loss in between resets the consecutive count
+    for loss in [nan_loss, nan_loss, torch.tensor(1.0), nan_loss, nan_loss]:
+        trainer.current_loss = loss
+        trainer.on_iteration_end()
+    # the end-of-epoch check inspects the remaining queued losses
+    trainer.check_training_status()
+    assert trainer._unchecked_losses == []
+    assert trainer.nan_counter == 2
+
+    trainer.current_loss = nan_loss
+    with pytest.raises(ValueError):
+        trainer.on_iteration_end()
+        trainer.check_training_status()
+
+
+def test_totalvae_protein_batch_mask():
+    n_genes, n_proteins = 7, 3
+    mask = {0: np.array([True, False, True]), 1: np.array([True, True, True])}
+    model = TOTALVAE(n_genes, n_proteins, n_batch=3, protein_batch_mask=mask)
+    model.eval()
+    table = model._protein_batch_mask_table
+    assert torch.equal(table[0], torch.tensor([1.0, 0.0, 1.0]))
+    assert torch.equal(table[1], torch.ones(n_proteins))
+    # batch codes without a mask entry are treated as unobserved
+    assert torch.equal(table[2], torch.zeros(n_proteins))
+
+    x = torch.randint(1, 10, (4, n_genes)).float()
+    y = torch.randint(1, 10, (4, n_proteins)).float()
+    l_mean = torch.zeros(4, 1)
+    l_var = torch.ones(4, 1)
+    batch_index = torch.tensor([[0], [2], [0], [2]])
+    reconst_loss_protein = model(x, y, l_mean, l_var, batch_index)[1]
+    assert torch.all(reconst_loss_protein[[1, 3]] == 0)
+    assert torch.all(reconst_loss_protein[[0, 2]] != 0)
+
+    # reassigning the mask takes effect on the next forward pass
+    model.protein_batch_mask = {0: np.zeros(n_proteins, dtype=bool)}
+    reconst_loss_protein = model(x, y, l_mean, l_var, batch_index)[1]
+    assert torch.all(reconst_loss_protein == 0)
@@ -1,8 +1,11 @@
 import numpy as np
 import pytest
 import torch
+from scipy.stats import spearmanr
+from sklearn.neighbors import NearestNeighbors
 
 from scvi.core import unsupervised_clustering_accuracy
+from scvi.core._metrics import knn_purity, nearest_neighbor_overlap
 from scvi.core.distributions import (
     ZeroInflatedNegativeBinomial,
     NegativeBinomial,
@@ -29,6 +32,53 @@ def test_deprecated_munkres():
     assert (assignment == np.array([[0, 3], [1, 1], [2, 2], [3, 0]])).all()
 
 
+def _dense_knn_adjacency(x, k):
+    indices = NearestNeighbors(n_neighbors=k).fit(x).kneighbors(return_distance=False)
+    adjacency = np.zeros((len(x), len(x)))
+    adjacency[np.arange(len(x))[:, None], indices] = 1
+    return adjacency
+
+
+def test_nearest_neighbor_overlap():
+    rng = np.random.RandomState(0)
+    x1 = rng.randn(120, 6)
+    x2 = x1 + 0.5 * rng.randn(120, 6)
+    k = 10
+
+    spearman_correlation, fold_enrichment = nearest_neighbor_overlap(x1, x2, k=k)
+
+    adjacency_1 = _dense_knn_adjacency(x1, k).flatten()
+    adjacency_2 = _dense_knn_adjacency(x2, k).flatten()
+    set_1 = set(np.where(adjacency_1 == 1)[0])
+    set_2 = set(np.where(adjacency_2 == 1)[0])
+    expected_enrichment = (
+        len(set_1.intersection(set_2)) * len(x1) ** 2 / (len(set_1) * len(set_2))
+    )
+    np.testing.assert_allclose(
+        spearman_correlation, spearmanr(adjacency_1, adjacency_2)[0]
+    )
+    np.testing.assert_allclose(fold_enrichment, expected_enrichment)
+
+
+def test_knn_purity():
+    rng = np.random.RandomState(0)
+    latent = rng.randn(150, 4)
+    labels = rng.randint(0, 3, size=150)
+
+    indices = (
+        NearestNeighbors(n_neighbors=11)
+        .fit(latent)
+        .kneighbors(latent, return_distance=False)[:, 1:]
+    )
+    scores = (labels[indices] == labels[:, None]).mean(axis=1)
+    expected = np.mean([scores[labels == i].mean() for i in np.unique(labels)])
+
+    np.testing.assert_allclose(knn_purity(latent, labels, n_neighbors=10), expected)
+    # labels only need to be comparable, not numeric
+    str_labels = np.array(["a", "b", "c"])[labels]
+    np.testing.assert_allclose(knn_purity(latent, str_labels, n_neighbors=10), expected)
+
+
 def test_zinb_distribution():
     theta = 100.0 + torch.rand(size=(2,))
     mu = 15.0 * torch.ones_like(theta)